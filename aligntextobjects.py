@@ -0,0 +1,148 @@
+"""Align text objects to a reference text object along X or Y.
+
+Pick a reference text, then the texts to align; a teal preview shows
+where they would land.  Accept bakes the move, Swap toggles the axis,
+Cancel leaves everything untouched.
+"""
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import Rhino
+
+from System import Array, Guid
+
+PREVIEW_LAYER = "_AlignTextPreview"
+_ANNOT = rs.filter.annotation
+_TEAL = (77, 249, 255)
+
+
+def ensure_preview_layer():
+    """Create (or reuse) the preview layer and return its name."""
+    if not rs.IsLayer(PREVIEW_LAYER):
+        rs.AddLayer(PREVIEW_LAYER, _TEAL)
+    else:
+        rs.LayerColor(PREVIEW_LAYER, _TEAL)
+    return PREVIEW_LAYER
+
+
+def show_preview(ref_pt, target_ids, base_pts, axis, layer):
+    """Copy each target to its aligned position on the preview layer.
+
+    One document write per target: the text entity is duplicated,
+    transformed in memory and added with the preview layer already set
+    on the attributes, all inside a single undo record.
+    """
+    layer_index = sc.doc.Layers.FindName(layer).Index
+    attrs = Rhino.DocObjects.ObjectAttributes()
+    attrs.LayerIndex = layer_index
+    # Resolve the axis once instead of comparing strings per target.
+    axis_idx = 0 if axis == "X" else 1
+    ax, ay = (1.0, 0.0) if axis_idx == 0 else (0.0, 1.0)
+    ref_val = ref_pt[axis_idx]
+    preview_ids = []
+    serial = sc.doc.BeginUndoRecord("AlignTextPreview")
+    try:
+        for tid, base_pt in zip(target_ids, base_pts):
+            delta = ref_val - base_pt[axis_idx]
+            xform = Rhino.Geometry.Transform.Translation(
+                delta * ax, delta * ay, 0)
+            obj = sc.doc.Objects.FindId(tid)
+            if obj is None:
+                continue
+            geo = obj.Geometry.Duplicate()
+            geo.Transform(xform)
+            copy = sc.doc.Objects.Add(geo, attrs)
+            if copy != Guid.Empty:
+                preview_ids.append(copy)
+    finally:
+        sc.doc.EndUndoRecord(serial)
+    return preview_ids
+
+
+def clear_preview(preview_ids, purge=True):
+    """Delete the preview copies; purge the layer only when asked.
+
+    Swap passes purge=False so the layer survives between previews
+    instead of being purged and re-added on every toggle.
+    """
+    if preview_ids:
+        sc.doc.Objects.Delete(Array[Guid](preview_ids), True)
+    if not purge:
+        return
+    if rs.IsLayer(PREVIEW_LAYER) and not rs.ObjectsByLayer(PREVIEW_LAYER):
+        rs.PurgeLayer(PREVIEW_LAYER)
+
+
+def commit_alignment(ref_pt, target_ids, base_pts, axis):
+    """Move the original texts to the previewed positions."""
+    axis_idx = 0 if axis == "X" else 1
+    ax, ay = (1.0, 0.0) if axis_idx == 0 else (0.0, 1.0)
+    ref_val = ref_pt[axis_idx]
+    moved = 0
+    for tid, base_pt in zip(target_ids, base_pts):
+        delta = ref_val - base_pt[axis_idx]
+        if rs.MoveObject(tid, (delta * ax, delta * ay, 0)):
+            moved += 1
+    return moved
+
+
+def main():
+    ref_id = rs.GetObject("Select reference text", _ANNOT)
+    if not ref_id:
+        return
+    target_ids = rs.GetObjects("Select texts to align", _ANNOT)
+    if not target_ids:
+        return
+    target_ids = [tid for tid in target_ids if tid != ref_id]
+    if not target_ids:
+        print("Nothing to align.")
+        return
+
+    ref_pt = rs.TextObjectPoint(ref_id)
+    if ref_pt is None:
+        return
+
+    # Query every base point once; Swap and Accept reuse this cache.
+    base_pts = [rs.TextObjectPoint(tid) for tid in target_ids]
+    keep = [i for i, p in enumerate(base_pts) if p is not None]
+    target_ids = [target_ids[i] for i in keep]
+    base_pts = [base_pts[i] for i in keep]
+    if not target_ids:
+        print("Nothing to align.")
+        return
+
+    axis = rs.GetString("Align along", "X", ["X", "Y"])
+    if axis is None:
+        return
+
+    layer = ensure_preview_layer()
+    rs.EnableRedraw(False)
+    preview_ids = show_preview(ref_pt, target_ids, base_pts, axis, layer)
+    rs.EnableRedraw(True)
+
+    while True:
+        action = rs.GetString("Preview shown", "Accept",
+                              ["Accept", "Swap", "Cancel"])
+        if action == "Accept":
+            rs.EnableRedraw(False)
+            clear_preview(preview_ids)
+            moved = commit_alignment(ref_pt, target_ids, base_pts, axis)
+            rs.EnableRedraw(True)
+            print("Aligned %d text object(s) along %s." % (moved, axis))
+            return
+        elif action == "Swap":
+            axis = "Y" if axis == "X" else "X"
+            rs.EnableRedraw(False)
+            clear_preview(preview_ids, purge=False)
+            preview_ids = show_preview(ref_pt, target_ids, base_pts,
+                                       axis, layer)
+            rs.EnableRedraw(True)
+        else:
+            rs.EnableRedraw(False)
+            clear_preview(preview_ids)
+            rs.EnableRedraw(True)
+            return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Bake the outer border curve of the bottom face of selected breps.
+
+Select closed breps (building volumes); the script finds the lowest face
+of each, extracts the outer border of that face and bakes the joined
+curves into a group, ready for piping with squarepipe.
+"""
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import Rhino
+
+from System import Guid
+
+_BREP = rs.filter.surface | rs.filter.polysurface
+
+
+def get_bottom_face(brep, tol):
+    """Return the BrepFace sitting lowest in Z, or None.
+
+    Ranks faces by the Z midpoint of their bounding box; one cheap
+    GetBoundingBox call per face instead of duplicating the face and
+    integrating its area just to read a centroid.  Only when several
+    faces tie on the bbox test are those few duplicated and their true
+    centroids compared, asking AreaMassProperties for first moments only
+    so the area/second/product moment integration is skipped.
+    """
+    # Common case first: a prism-like brep has a planar, horizontal
+    # face sitting on the bounding-box floor. Return it straight away
+    # without ranking anything.
+    bbox_min_z = brep.GetBoundingBox(True).Min.Z
+    for face in brep.Faces:
+        ok, plane = face.TryGetPlane(tol)
+        if not ok:
+            continue
+        if abs(plane.Normal.Z) >= 1.0 - 1e-6 and \
+                abs(plane.OriginZ - bbox_min_z) <= tol:
+            return face
+
+    lowest_face = None
+    lowest_z = None
+    candidates = []
+    for face in brep.Faces:
+        bbox = face.GetBoundingBox(True)
+        z = 0.5 * (bbox.Min.Z + bbox.Max.Z)
+        if lowest_z is None or z < lowest_z - tol:
+            lowest_z = z
+            lowest_face = face
+            candidates = [face]
+        elif abs(z - lowest_z) <= tol:
+            candidates.append(face)
+    if len(candidates) < 2:
+        return lowest_face
+    best_face = None
+    best_z = None
+    for face in candidates:
+        fbrep = face.DuplicateFace(False)
+        amp = Rhino.Geometry.AreaMassProperties.Compute(
+            fbrep, False, True, False, False)
+        if amp is None:
+            continue
+        cz = amp.Centroid.Z
+        if best_z is None or cz < best_z:
+            best_z = cz
+            best_face = face
+    return best_face or lowest_face
+
+
+def get_outer_border_curves(face):
+    """Return the joined 3d curve of the face's outer loop."""
+    c = face.OuterLoop.To3dCurve()
+    return [c] if c else []
+
+
+def main():
+    ids = rs.GetObjects("Select breps", _BREP, preselect=True)
+    if not ids:
+        return
+
+    tol = sc.doc.ModelAbsoluteTolerance
+    all_curves = []
+    for oid in ids:
+        brep = rs.coercebrep(oid)
+        if brep is None:
+            continue
+        face = get_bottom_face(brep, tol)
+        if face is None:
+            continue
+        all_curves.extend(get_outer_border_curves(face))
+
+    rs.EnableRedraw(False)
+    baked = []
+    serial = sc.doc.BeginUndoRecord("BottomCurvePiping")
+    try:
+        for crv in all_curves:
+            cid = sc.doc.Objects.AddCurve(crv)
+            if cid != Guid.Empty:
+                baked.append(cid)
+        if baked:
+            sc.doc.Groups.Add("BottomFaceCurves", baked)
+    finally:
+        sc.doc.EndUndoRecord(serial)
+    rs.EnableRedraw(True)
+    print("Baked %d bottom border curve(s)." % len(baked))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""Scatter people (a block or a source object) over a mesh or surface.
+
+Pick the target, the thing to scatter and a count; samples are spread
+by area with optional random rotation, normal alignment and scale. A
+preview is shown first - No re-rolls, Yes bakes to a fresh layer.
+"""
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import Rhino
+import math
+import numpy as np
+
+from System import Guid
+
+_TARGET = rs.filter.mesh | rs.filter.surface | rs.filter.polysurface
+
+# One PCG64 stream for every draw in the script; batched pulls from it
+# replace the per-sample Mersenne Twister calls.
+_RNG = np.random.default_rng()
+
+# Prepared samplers keyed by mesh id; preview re-rolls on the same
+# mesh reuse them instead of re-extracting faces and rebuilding the
+# distribution.
+_SAMPLER_CACHE = {}
+
+
+def _build_alias(areas):
+    """Walker alias table (Vose's method) for the area distribution.
+
+    Returns (prob, alias) arrays; drawing a triangle is then one
+    uniform for the bin and one for the coin flip, O(1) per sample.
+    """
+    f = np.asarray(areas, dtype=np.float64)
+    nbins = len(f)
+    prob = np.zeros(nbins)
+    alias = np.zeros(nbins, dtype=np.int64)
+    scaled = f * (nbins / f.sum())
+    small = [i for i in range(nbins) if scaled[i] < 1.0]
+    large = [i for i in range(nbins) if scaled[i] >= 1.0]
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = g
+        scaled[g] -= 1.0 - scaled[s]
+        if scaled[g] < 1.0:
+            small.append(g)
+        else:
+            large.append(g)
+    for i in small:
+        prob[i] = 1.0
+    for i in large:
+        prob[i] = 1.0
+    return prob, alias
+
+
+def _bb_center(obj_id):
+    """Centre of the object's bounding box."""
+    obj = sc.doc.Objects.FindId(obj_id)
+    if obj is None:
+        return None
+    return obj.Geometry.GetBoundingBox(True).Center
+
+
+def _ensure_new_layer(base):
+    """Return a layer name derived from base that does not exist yet.
+
+    One pass over the layer table builds a name set; candidate names
+    are then checked with O(1) membership instead of an rs.IsLayer scan
+    per try.
+    """
+    existing = set(layer.Name for layer in sc.doc.Layers
+                   if not layer.IsDeleted)
+    name = base
+    i = 1
+    while name in existing:
+        name = "%s_%02d" % (base, i)
+        i += 1
+    rs.AddLayer(name)
+    return name
+
+
+def _barycentric_points(n, tri_verts):
+    """Place n uniform points over (n,3,3) gathered triangle vertices.
+
+    Builds the (n,3) barycentric weight matrix in one shot and
+    multiplies it against the vertex stack with einsum; no per-point
+    sqrt or coordinate arithmetic in Python.
+    """
+    r1 = _RNG.random(n)
+    r2 = _RNG.random(n)
+    s1 = np.sqrt(r1)
+    b = np.column_stack([1.0 - s1, s1 * (1.0 - r2), s1 * r2])
+    return np.einsum('ni,nij->nj', b, tri_verts)
+
+
+def _prepare_mesh_sampler(mesh_id):
+    """Extract the per-triangle arrays for sampling, cached by mesh id.
+
+    Coercing, triangulating and pulling vertex/face data out of the
+    mesh happens once here; the preview loop only draws from the
+    returned arrays.
+    """
+    sampler = _SAMPLER_CACHE.get(mesh_id)
+    if sampler is not None:
+        return sampler
+    mesh = rs.coercemesh(mesh_id)
+    if mesh is None:
+        return None
+    mesh = mesh.DuplicateMesh()
+    mesh.Faces.ConvertQuadsToTriangles()
+
+    # Rhino stores mesh vertices as float32; keeping the SoA buffers in
+    # float32 halves the bytes moved through the cache for the
+    # cross-product and area passes. Only the final Point3d/Vector3d
+    # construction widens to double.
+    verts = np.asarray(mesh.Vertices.ToFloatArray(),
+                       dtype=np.float32).reshape(-1, 3)
+    faces = np.array([(f.A, f.B, f.C)
+                      for f in (mesh.Faces.GetFace(i)
+                                for i in range(mesh.Faces.Count))],
+                     dtype=np.int64)
+    P = verts[faces]                      # (F, 3, 3) float32
+    e1 = P[:, 1] - P[:, 0]
+    e2 = P[:, 2] - P[:, 0]
+    crosses = np.cross(e1, e2)
+    areas = 0.5 * np.linalg.norm(crosses, axis=1).astype(np.float32)
+    if float(areas.sum()) <= 0.0:
+        return None
+    safe = np.where(areas > 0.0, areas, 1.0)
+    normals = crosses / (2.0 * safe[:, None])
+    prob, alias = _build_alias(areas)
+    sampler = {"P": P, "areas": areas, "normals": normals,
+               "prob": prob, "alias": alias}
+    _SAMPLER_CACHE[mesh_id] = sampler
+    return sampler
+
+
+def _sample_on_mesh(sampler, n):
+    """Draw n (point, normal) samples from a prepared mesh sampler."""
+    P = sampler["P"]
+    normals = sampler["normals"]
+    prob = sampler["prob"]
+    alias = sampler["alias"]
+
+    # Draw all triangles through the alias table - O(1) per sample -
+    # then place every point in one barycentric batch.
+    bins = _RNG.integers(0, len(prob), n)
+    coin = _RNG.random(n)
+    face_idx = np.where(coin < prob[bins], bins, alias[bins])
+
+    pts = _barycentric_points(n, P[face_idx])
+    nrms = normals[face_idx]
+
+    samples = []
+    for k in range(n):
+        samples.append((Rhino.Geometry.Point3d(*pts[k]),
+                        Rhino.Geometry.Vector3d(*nrms[k])))
+    return samples
+
+
+def _sample_on_surface(srf_id, n):
+    """Return n (point, normal) samples in the surface's uv domain.
+
+    The surface is coerced once and all uv pairs drawn up front; each
+    sample is a single Evaluate call whose first derivatives give the
+    normal, instead of separate EvaluateSurface and SurfaceNormal round
+    trips. (This also fixes v being drawn from a range that started at
+    the u domain.)
+    """
+    srf = rs.coercesurface(srf_id)
+    if srf is None:
+        return []
+    udom = srf.Domain(0)
+    vdom = srf.Domain(1)
+    us = _RNG.uniform(udom.T0, udom.T1, n)
+    vs = _RNG.uniform(vdom.T0, vdom.T1, n)
+    samples = []
+    for ui, vi in zip(us, vs):
+        ok, pt, derivs = srf.Evaluate(float(ui), float(vi), 1)
+        if not ok:
+            continue
+        nrm = Rhino.Geometry.Vector3d.CrossProduct(derivs[0], derivs[1])
+        nrm.Unitize()
+        samples.append((pt, nrm))
+    return samples
+
+
+def _build_instance_xform(center, normal, angle, do_align, scale):
+    """Compose rotation, normal alignment and scale into one transform.
+
+    angle (degrees) and scale come pre-drawn from the batched RNG
+    streams; either may be None to skip that component. Scale is
+    applied last (it is uniform, so order against the rotations does
+    not matter numerically, but composing here keeps a single matrix
+    per instance).
+    """
+    xform = Rhino.Geometry.Transform.Identity
+    if angle is not None:
+        xform = Rhino.Geometry.Transform.Rotation(
+            math.radians(angle), Rhino.Geometry.Vector3d.ZAxis,
+            center) * xform
+    if do_align:
+        nrm = Rhino.Geometry.Vector3d(normal)
+        nrm.Unitize()
+        # Scattering onto flat ground is the common case; a normal that
+        # already is Z would only compose an identity rotation.
+        if (abs(nrm.Z - 1.0) > 1e-6 or abs(nrm.X) > 1e-6
+                or abs(nrm.Y) > 1e-6):
+            xform = Rhino.Geometry.Transform.Rotation(
+                Rhino.Geometry.Vector3d.ZAxis, nrm, center) * xform
+    if scale is not None:
+        xform = Rhino.Geometry.Transform.Scale(center, scale) * xform
+    return xform
+
+
+def main():
+    target = rs.GetObject("Select mesh or surface to scatter on",
+                          _TARGET, preselect=True)
+    if not target:
+        return
+
+    block_name = None
+    names = rs.BlockNames(True)
+    if names:
+        block_name = rs.GetString(
+            "Block to scatter (Enter to pick an object instead)")
+        if block_name and block_name not in names:
+            print("No block called '%s'." % block_name)
+            return
+    src = None
+    if not block_name:
+        src = rs.GetObject("Select object to scatter")
+        if not src:
+            return
+    use_block = block_name is not None and len(block_name) > 0
+
+    n = rs.GetInteger("Number of people", 50, 1)
+    if n is None:
+        return
+    do_rotate = rs.GetString("Random rotation", "Yes", ["Yes", "No"]) == "Yes"
+    do_align = rs.GetString("Align to normal", "No", ["Yes", "No"]) == "Yes"
+    do_scale = rs.GetString("Random scale", "Yes", ["Yes", "No"]) == "Yes"
+
+    idef_idx = -1
+    base_center = None
+    src_geo = None
+    if not use_block:
+        base_center = _bb_center(src)
+        if base_center is None:
+            return
+        # Coerce the source geometry once; every sample duplicates the
+        # in-memory copy instead of re-looking the id up in the table.
+        src_geo = rs.coercegeometry(src)
+        if src_geo is None:
+            return
+    if use_block:
+        # Resolve the instance definition once; every insert goes
+        # straight through the object table with it.
+        idef_idx = sc.doc.InstanceDefinitions.Find(block_name, True).Index
+
+    is_mesh = rs.IsMesh(target)
+    sampler = None
+    if is_mesh:
+        sampler = _prepare_mesh_sampler(target)
+        if sampler is None:
+            print("Sampling failed.")
+            return
+    preview_layer = _ensure_new_layer("People_Preview")
+    # One attributes object shared by every insert, with the preview
+    # layer already set, so instances land on their layer in the same
+    # document write that creates them.
+    preview_attrs = Rhino.DocObjects.ObjectAttributes()
+    preview_attrs.LayerIndex = sc.doc.Layers.FindByFullPath(
+        preview_layer, -1)
+
+    samples = None
+    while True:
+        # Positions persist across Reshuffle retries; only Resample
+        # (or the first pass) draws new ones.
+        if samples is None:
+            if is_mesh:
+                samples = _sample_on_mesh(sampler, n)
+            else:
+                samples = _sample_on_surface(target, n)
+            if not samples:
+                print("Sampling failed.")
+                return
+
+        # Draw every random angle and scale for this preview in two
+        # batched pulls instead of one interpreted call per instance.
+        k = len(samples)
+        angles = _RNG.uniform(0.0, 360.0, k) if do_rotate else None
+        scales = _RNG.uniform(0.8, 1.2, k) if do_scale else None
+
+        rs.EnableRedraw(False)
+        preview_ids = []
+        # One undo record for the whole batch; Rhino otherwise books a
+        # record per inserted object.
+        undo_serial = sc.doc.BeginUndoRecord("ScatterPreview")
+        for i, (pt, normal) in enumerate(samples):
+            angle = angles[i] if do_rotate else None
+            scale = scales[i] if do_scale else None
+            if use_block:
+                xform = Rhino.Geometry.Transform.Translation(
+                    pt - Rhino.Geometry.Point3d.Origin)
+                if do_rotate or do_align or do_scale:
+                    xform = _build_instance_xform(
+                        pt, normal, angle, do_align, scale) * xform
+                oid = sc.doc.Objects.AddInstanceObject(idef_idx, xform,
+                                                       preview_attrs)
+                if oid == Guid.Empty:
+                    continue
+            else:
+                xform = Rhino.Geometry.Transform.Translation(
+                    pt - base_center)
+                if do_rotate or do_align or do_scale:
+                    xform = _build_instance_xform(
+                        pt, normal, angle, do_align, scale) * xform
+                dup = src_geo.Duplicate()
+                dup.Transform(xform)
+                oid = sc.doc.Objects.Add(dup, preview_attrs)
+                if oid == Guid.Empty:
+                    continue
+            preview_ids.append(oid)
+        sc.doc.EndUndoRecord(undo_serial)
+        rs.EnableRedraw(True)
+
+        answer = rs.GetString(
+            "Keep this arrangement? (Reshuffle keeps the positions)",
+            "Yes", ["Yes", "Reshuffle", "Resample", "Cancel"])
+        if answer == "Yes":
+            bake_layer = _ensure_new_layer("People")
+            rs.EnableRedraw(False)
+            # rs.ObjectLayer takes the whole list: one layer lookup,
+            # attributes applied in a tight managed loop.
+            rs.ObjectLayer(preview_ids, bake_layer)
+            rs.PurgeLayer(preview_layer)
+            rs.EnableRedraw(True)
+            print("Placed %d people on '%s'." % (len(preview_ids),
+                                                 bake_layer))
+            return
+        elif answer in ("Reshuffle", "Resample"):
+            rs.EnableRedraw(False)
+            rs.DeleteObjects(preview_ids)
+            rs.EnableRedraw(True)
+            if answer == "Resample":
+                samples = None
+        else:
+            rs.EnableRedraw(False)
+            rs.DeleteObjects(preview_ids)
+            rs.PurgeLayer(preview_layer)
+            rs.EnableRedraw(True)
+            return
+
+
+if __name__ == "__main__":
+    main()
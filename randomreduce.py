@@ -0,0 +1,50 @@
+"""Randomly delete a percentage of the selected objects.
+
+Handy for thinning out dense scatters (trees, people, hatching blocks)
+without picking objects by hand.
+"""
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import random
+
+from System import Array, Guid
+
+
+def pick_random(ids, n_delete):
+    """Choose n_delete ids with a partial Fisher-Yates shuffle.
+
+    Only the first n_delete slots are shuffled, so selection is O(k)
+    and works in place on an index list instead of the pool-and-reject
+    machinery of random.sample.
+    """
+    rnd = random.random
+    n = len(ids)
+    idx = list(range(n))
+    for i in range(n_delete):
+        j = i + int(rnd() * (n - i))
+        idx[i], idx[j] = idx[j], idx[i]
+    return [ids[i] for i in idx[:n_delete]]
+
+
+def main():
+    ids = rs.GetObjects("Select objects to reduce", preselect=True)
+    if not ids:
+        return
+    percent = rs.GetReal("Percentage to delete", 50.0, 0.0, 100.0)
+    if percent is None:
+        return
+    n_delete = int(round(len(ids) * percent / 100.0))
+    if n_delete < 1:
+        print("Nothing to delete.")
+        return
+
+    to_delete = pick_random(ids, n_delete)
+    rs.EnableRedraw(False)
+    sc.doc.Objects.Delete(Array[Guid](to_delete), True)
+    rs.EnableRedraw(True)
+    print("Deleted %d of %d object(s)." % (n_delete, len(ids)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Sweep a simple graded road ramp along a flat rail curve.
+
+Select a flat rail curve and give a width and slope; the script previews
+the ramp footprint (sections, graded right edge and level dots) and lets
+you flip the slope direction or the offset side before sweeping the
+final surface.
+"""
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import Rhino
+import numpy as np
+
+from System import Array, Guid
+
+SAMPLES = 25
+_CURVE = rs.filter.curve
+
+
+def is_flat_curve(curve_id, tol=0.001):
+    """True when the curve's sampled Z range stays within tol."""
+    crv = rs.coercecurve(curve_id)
+    if crv is None:
+        return False
+    params = crv.DivideByCount(50, True)
+    if not params:
+        return False
+    zs = np.fromiter((crv.PointAt(t).Z for t in params),
+                     dtype=np.float64, count=len(params))
+    return (zs.max() - zs.min()) <= tol
+
+
+def param_from_normalised(crv, u):
+    """Map a 0..1 value onto the curve's parameter domain."""
+    return crv.Domain.ParameterAt(u)
+
+
+def build_right_edge_points(crv, width, offset_dir, dz_along,
+                            slope_sign, samples=SAMPLES):
+    """Sample the graded outer edge of the ramp as a list of points.
+
+    Takes the already-coerced rail Curve; tangents, laterals and the
+    grading are computed column-wise on ndarrays instead of per-sample
+    Vector3d arithmetic.
+    """
+    us = np.linspace(0.0, 1.0, samples + 1)
+    dom = crv.Domain
+    params = [dom.ParameterAt(u) for u in us]
+    pts = np.array([(p.X, p.Y, p.Z)
+                    for p in (crv.PointAt(t) for t in params)])
+    tans = np.array([(v.X, v.Y, v.Z)
+                     for v in (crv.TangentAt(t) for t in params)])
+    tans /= np.linalg.norm(tans, axis=1, keepdims=True)
+    lateral = np.cross([0.0, 0.0, 1.0], tans)
+    lateral /= np.linalg.norm(lateral, axis=1, keepdims=True)
+    signed_dz = dz_along if slope_sign > 0 else -dz_along
+    graded = pts + lateral * (width * offset_dir)
+    graded[:, 2] -= us * signed_dz
+    return [tuple(p) for p in graded]
+
+
+def make_perp_section(crv, u, width, offset_dir, dz):
+    """Build one section line from the rail out to the graded edge.
+
+    Returns a non-document LineCurve; the caller bakes it only when it
+    is needed on screen.
+    """
+    t = param_from_normalised(crv, u)
+    pt = crv.PointAt(t)
+    tan = crv.TangentAt(t)
+    lateral = Rhino.Geometry.Vector3d.CrossProduct(
+        Rhino.Geometry.Vector3d.ZAxis, tan)
+    lateral.Unitize()
+    outer = Rhino.Geometry.Point3d(pt.X + lateral.X * width * offset_dir,
+                                   pt.Y + lateral.Y * width * offset_dir,
+                                   pt.Z - dz)
+    return Rhino.Geometry.LineCurve(pt, outer)
+
+
+def build_preview(rail_crv, width, offset_dir, dz_along, slope_sign):
+    """Bake the preview objects.
+
+    Returns (prev_ids, lc0, lc1); the section LineCurves stay in memory
+    so Proceed can sweep them without the document ever owning them.
+    """
+    prev_ids = []
+    dz1 = dz_along if slope_sign > 0 else -dz_along
+    lc0 = make_perp_section(rail_crv, 0.0, width, offset_dir, 0.0)
+    lc1 = make_perp_section(rail_crv, 1.0, width, offset_dir, dz1)
+    prev_ids.append(sc.doc.Objects.AddCurve(lc0))
+    prev_ids.append(sc.doc.Objects.AddCurve(lc1))
+    edge_pts = build_right_edge_points(rail_crv, width, offset_dir,
+                                       dz_along, slope_sign)
+    edge = rs.AddInterpCurve(edge_pts)
+    if edge:
+        prev_ids.append(edge)
+    dot0 = rs.AddTextDot("+0.00", rail_crv.PointAt(
+        param_from_normalised(rail_crv, 0.0)))
+    dot1 = rs.AddTextDot("%+.2f" % -dz1, edge_pts[-1])
+    prev_ids.extend([dot0, dot1])
+    return prev_ids, lc0, lc1
+
+
+def _outer_border(srf_id):
+    """Return the longest border curve of the surface, deleting the rest."""
+    crvs = rs.DuplicateSurfaceBorder(srf_id, 1)
+    if not crvs:
+        return None
+    if len(crvs) == 1:
+        return crvs[0]
+    best_idx = 0
+    best_len = rs.coercecurve(crvs[0]).GetLength()
+    for i in range(1, len(crvs)):
+        length = rs.coercecurve(crvs[i]).GetLength()
+        if length > best_len:
+            best_len = length
+            best_idx = i
+    others = [c for i, c in enumerate(crvs) if i != best_idx]
+    sc.doc.Objects.Delete(Array[Guid](others), True)
+    return crvs[best_idx]
+
+
+def main():
+    rail = rs.GetObject("Select flat rail curve", _CURVE, preselect=True)
+    if not rail:
+        return
+    if not is_flat_curve(rail):
+        print("Rail curve must be flat.")
+        return
+    width = rs.GetReal("Ramp width", 3.0, 0.01)
+    if width is None:
+        return
+    slope = rs.GetReal("Slope (rise/run)", 0.05, 0.0)
+    if slope is None:
+        return
+    # Coerce the rail once; everything downstream works on the Curve.
+    rail_crv = rs.coercecurve(rail)
+    dz_along = rail_crv.GetLength() * slope
+
+    offset_dir = 1
+    slope_sign = 1
+    # Redraw stays off for the whole interaction; each assembled
+    # preview is pushed to screen with a single explicit redraw.
+    rs.EnableRedraw(False)
+    while True:
+        prev_ids, lc0, lc1 = build_preview(rail_crv, width, offset_dir,
+                                           dz_along, slope_sign)
+        sc.doc.Views.Redraw()
+        action = rs.GetString("Ramp preview", "Proceed",
+                              ["Proceed", "FlipSlope", "FlipSide", "Cancel"])
+        if action == "Proceed":
+            # Delete the preview blind; Objects.Delete ignores anything
+            # already gone. The section curves never entered the document.
+            sc.doc.Objects.Delete(Array[Guid](prev_ids), True)
+            breps = Rhino.Geometry.Brep.CreateFromSweep(
+                rail_crv, [lc0, lc1], False, sc.doc.ModelAbsoluteTolerance)
+            if breps:
+                for brep in breps:
+                    bid = sc.doc.Objects.AddBrep(brep)
+                    _outer_border(bid)
+                print("Ramp created.")
+            else:
+                print("Sweep failed.")
+            rs.EnableRedraw(True)
+            return
+        elif action in ("FlipSlope", "FlipSide"):
+            if action == "FlipSlope":
+                slope_sign = -slope_sign
+            else:
+                offset_dir = -offset_dir
+            sc.doc.Objects.Delete(Array[Guid](prev_ids), True)
+        else:
+            sc.doc.Objects.Delete(Array[Guid](prev_ids), True)
+            rs.EnableRedraw(True)
+            return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Report the gross floor area of selected building volumes.
+
+Select closed breps; the footprint of each (its lowest face) is
+measured and the total is printed in square metres, whatever the model
+units are.
+"""
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import Rhino
+
+_BREP = rs.filter.surface | rs.filter.polysurface
+
+
+def get_bottom_face(brep):
+    """Return the lowest BrepFace, or None.
+
+    Picking the footprint only needs a rough lowest-Z discriminator,
+    so the bounding-box centre Z decides the winner outright; the one
+    precise area integration happens on that single face in main.
+    """
+    faces = brep.Faces
+    count = faces.Count
+    if count == 0:
+        return None
+    best_face = None
+    best_z = None
+    for i in range(count):
+        z = faces[i].GetBoundingBox(True).Center.Z
+        if best_z is None or z < best_z:
+            best_z = z
+            best_face = faces[i]
+    return best_face
+
+
+def main():
+    ids = rs.GetObjects("Select building volumes", _BREP, preselect=True)
+    if not ids:
+        return
+
+    total_area_model = 0.0
+    counted = 0
+    for oid in ids:
+        brep = rs.coercebrep(oid)
+        if brep is None:
+            continue
+        face = get_bottom_face(brep)
+        if face is None:
+            continue
+        amp = Rhino.Geometry.AreaMassProperties.Compute(face)
+        if amp is None:
+            continue
+        total_area_model += amp.Area
+        counted += 1
+
+    # Accumulate in model units and convert once at the end; keep the
+    # UnitScale call and the squaring out of the per-brep loop.
+    scale2 = Rhino.RhinoMath.UnitScale(sc.doc.ModelUnitSystem,
+                                       Rhino.UnitSystem.Meters) ** 2
+    total_m2 = round(total_area_model * scale2, 2)
+    print("GFA across %d volume(s): %.2f m2" % (counted, total_m2))
+
+
+if __name__ == "__main__":
+    main()